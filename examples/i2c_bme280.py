@@ -24,7 +24,9 @@ bme = adafruit_bme280.Adafruit_BME280_I2C(i2c)
 px = Plexus(source_id="pi-lab-01")
 
 while True:
-    px.send("temperature", bme.temperature)
-    px.send("humidity", bme.relative_humidity)
-    px.send("pressure", bme.pressure)
+    px.send_batch([
+        ("temperature", bme.temperature),
+        ("humidity", bme.relative_humidity),
+        ("pressure", bme.pressure),
+    ])
     time.sleep(2)
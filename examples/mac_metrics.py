@@ -37,20 +37,23 @@ while True:
     cpu = psutil.cpu_percent(interval=None)
     mem = psutil.virtual_memory()
 
-    # Numeric metrics
-    px.send("cpu.percent",     cpu)
-    px.send("memory.used_gb",  mem.used / 1e9)
-    px.send("memory.percent",  mem.percent)
-    px.send("net.rx_mbps",     (net.bytes_recv  - prev_net.bytes_recv)   / 1e6)
-    px.send("net.tx_mbps",     (net.bytes_sent  - prev_net.bytes_sent)   / 1e6)
-    px.send("disk.read_mbps",  (disk.read_bytes  - prev_disk.read_bytes)  / 1e6)
-    px.send("disk.write_mbps", (disk.write_bytes - prev_disk.write_bytes) / 1e6)
-    px.send("disk.free_gb",    psutil.disk_usage("/").free / 1e9)
+    # Numeric metrics — one batch per tick so they share a timestamp and go
+    # out as a single frame instead of one frame per metric.
+    metrics = [
+        ("cpu.percent",     cpu),
+        ("memory.used_gb",  mem.used / 1e9),
+        ("memory.percent",  mem.percent),
+        ("net.rx_mbps",     (net.bytes_recv  - prev_net.bytes_recv)   / 1e6),
+        ("net.tx_mbps",     (net.bytes_sent  - prev_net.bytes_sent)   / 1e6),
+        ("disk.read_mbps",  (disk.read_bytes  - prev_disk.read_bytes)  / 1e6),
+        ("disk.write_mbps", (disk.write_bytes - prev_disk.write_bytes) / 1e6),
+        ("disk.free_gb",    psutil.disk_usage("/").free / 1e9),
+    ]
 
     # Battery metrics + charge-state change event
     battery = psutil.sensors_battery()
     if battery:
-        px.send("battery.percent", battery.percent)
+        metrics.append(("battery.percent", battery.percent))
         charging = battery.power_plugged
         if charging != prev_charging and prev_charging is not None:
             px.event("battery.state_change", {
@@ -59,6 +62,8 @@ while True:
             })
         prev_charging = charging
 
+    px.send_batch(metrics)
+
     # CPU spike event — fires once per interval when threshold is crossed
     if cpu >= CPU_SPIKE_THRESHOLD:
         top = max(psutil.process_iter(["name", "cpu_percent"]), key=lambda p: p.info["cpu_percent"] or 0)
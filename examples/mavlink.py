@@ -26,14 +26,22 @@ while True:
         continue
     t = msg.get_type()
 
+    # One send_batch per MAVLink message: fields from the same message share
+    # a timestamp and travel in a single frame.
     if t == "ATTITUDE":
-        px.send("attitude.roll", msg.roll)
-        px.send("attitude.pitch", msg.pitch)
-        px.send("attitude.yaw", msg.yaw)
+        px.send_batch([
+            ("attitude.roll", msg.roll),
+            ("attitude.pitch", msg.pitch),
+            ("attitude.yaw", msg.yaw),
+        ])
     elif t == "GLOBAL_POSITION_INT":
-        px.send("gps.lat", msg.lat / 1e7)
-        px.send("gps.lon", msg.lon / 1e7)
-        px.send("gps.alt_m", msg.alt / 1000.0)
+        px.send_batch([
+            ("gps.lat", msg.lat / 1e7),
+            ("gps.lon", msg.lon / 1e7),
+            ("gps.alt_m", msg.alt / 1000.0),
+        ])
     elif t == "SYS_STATUS":
-        px.send("battery.voltage", msg.voltage_battery / 1000.0)
-        px.send("battery.current", msg.current_battery / 100.0)
+        px.send_batch([
+            ("battery.voltage", msg.voltage_battery / 1000.0),
+            ("battery.current", msg.current_battery / 100.0),
+        ])
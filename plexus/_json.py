@@ -0,0 +1,47 @@
+import json
+import math
+
+# One encoder for every wire payload, built once. Compact separators keep
+# whitespace off the wire; check_circular is off because points are plain
+# trees, so the per-container id() bookkeeping is pure overhead.
+_ENCODER = json.JSONEncoder(separators=(",", ":"), check_circular=False)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # orjson is several times faster on both sides and produces the same
+    # compact output. Anything it refuses (ints wider than 64 bits, non-str
+    # keys) falls back to the stdlib encoder. One difference: NaN/Infinity
+    # go out as null, which is valid JSON, where the stdlib writes bare NaN.
+    _OPTS = orjson.OPT_SERIALIZE_NUMPY
+
+    def _nan_to_null(obj):
+        # Match orjson on the fallback path so whatever we write, loads()
+        # can read back.
+        if isinstance(obj, float):
+            return obj if math.isfinite(obj) else None
+        if isinstance(obj, dict):
+            return {k: _nan_to_null(v) for k, v in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [_nan_to_null(v) for v in obj]
+        return obj
+
+    def dumps(obj) -> str:
+        try:
+            return orjson.dumps(obj, option=_OPTS).decode("utf-8")
+        except TypeError:
+            return _ENCODER.encode(_nan_to_null(obj))
+
+    def loads(s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # Bare NaN/Infinity, as written by the stdlib encoder — e.g.
+            # rows persisted in a SqliteBuffer before orjson was installed.
+            return json.loads(s)
+else:
+    dumps = _ENCODER.encode
+    loads = json.loads
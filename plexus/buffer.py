@@ -11,7 +11,6 @@ Store-and-forward:
   devices like satellites or field robots that buffer for hours/days.
 """
 
-import json
 import logging
 import os
 import sqlite3
@@ -19,6 +18,8 @@ import threading
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from plexus import _json
+
 logger = logging.getLogger(__name__)
 
 
@@ -158,6 +159,13 @@ class SqliteBuffer(BufferBackend):
             ")"
         )
         self._conn.commit()
+        # Row count as last seen by this instance. Lets get_all() skip the
+        # SELECT on the common empty case; every query that observes the
+        # real count refreshes it. The file is shared by every client on the
+        # host, so a zero count is only trusted while PRAGMA data_version
+        # shows no commits from other connections since we last looked.
+        self._data_version = self._read_data_version()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM points").fetchone()[0]
 
     def add(self, points: List[Dict[str, Any]]) -> None:
         if not points:
@@ -173,25 +181,34 @@ class SqliteBuffer(BufferBackend):
                     pass
             self._conn.executemany(
                 "INSERT INTO points (data) VALUES (?)",
-                [(json.dumps(p),) for p in points],
+                [(_json.dumps(p),) for p in points],
             )
             self._conn.commit()
+            self._count += len(points)
             self._evict()
 
     def get_all(self) -> List[Dict[str, Any]]:
         with self._lock:
+            version = self._read_data_version()
+            if not self._count and version == self._data_version:
+                return []
             cursor = self._conn.execute("SELECT data FROM points ORDER BY id")
-            return [json.loads(row[0]) for row in cursor.fetchall()]
+            rows = cursor.fetchall()
+            self._count = len(rows)
+            self._data_version = version
+            return [_json.loads(row[0]) for row in rows]
 
     def clear(self) -> None:
         with self._lock:
             self._conn.execute("DELETE FROM points")
             self._conn.commit()
+            self._count = 0
 
     def size(self) -> int:
         with self._lock:
             cursor = self._conn.execute("SELECT COUNT(*) FROM points")
-            return cursor.fetchone()[0]
+            self._count = cursor.fetchone()[0]
+            return self._count
 
     def resize(self, max_size: int) -> None:
         with self._lock:
@@ -212,9 +229,10 @@ class SqliteBuffer(BufferBackend):
             )
             rows = cursor.fetchall()
             if not rows:
+                self._count = 0
                 return [], 0
 
-            points = [json.loads(row[1]) for row in rows]
+            points = [_json.loads(row[1]) for row in rows]
             ids = [row[0] for row in rows]
 
             # Delete the exact rows we read
@@ -226,6 +244,7 @@ class SqliteBuffer(BufferBackend):
             self._conn.commit()
 
             remaining = self._conn.execute("SELECT COUNT(*) FROM points").fetchone()[0]
+            self._count = remaining
             return points, remaining
 
     def close(self) -> None:
@@ -233,12 +252,17 @@ class SqliteBuffer(BufferBackend):
         with self._lock:
             self._conn.close()
 
+    def _read_data_version(self) -> int:
+        """Changes whenever another connection commits to the database."""
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
     def _evict(self) -> None:
         """Remove oldest rows if over max_size. Must be called with lock held."""
         if self._max_size is None:
             return
         cursor = self._conn.execute("SELECT COUNT(*) FROM points")
         count = cursor.fetchone()[0]
+        self._count = count
         if count > self._max_size:
             overflow = count - self._max_size
             self._conn.execute(
@@ -248,6 +272,7 @@ class SqliteBuffer(BufferBackend):
                 (overflow,),
             )
             self._conn.commit()
+            self._count = self._max_size
             logger.warning("Buffer full, dropped %d oldest points", overflow)
             if self._on_overflow:
                 self._on_overflow(overflow)
@@ -264,6 +289,7 @@ class SqliteBuffer(BufferBackend):
             (to_drop,),
         )
         self._conn.commit()
+        self._count = max(0, count - to_drop)
         logger.warning("Disk safety: dropped %d oldest points", to_drop)
         if self._on_overflow:
             self._on_overflow(to_drop)
@@ -23,7 +23,7 @@ import base64
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import cv2
 import numpy as np
@@ -78,7 +78,7 @@ class ThermalCamera(ABC):
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ThermalFrame:
     """Encoded output from a ThermalCamera, ready to send to the gateway."""
 
@@ -146,11 +146,16 @@ def build_thermal_frame(
     temp_max = float(np.max(temps))
     span = temp_max - temp_min
 
-    normalized = (
-        np.zeros((sh, sw), dtype=np.uint8)
-        if span < 1e-6
-        else ((temps - temp_min) / span * 255).astype(np.uint8)
-    )
+    if span < 1e-6:
+        normalized = np.zeros((sh, sw), dtype=np.uint8)
+    else:
+        # Same arithmetic as (temps - min) / span * 255, but the divide and
+        # multiply run in place on one float32 buffer instead of allocating
+        # a temporary per step.
+        scaled = np.subtract(temps, temp_min, dtype=np.float32)
+        scaled /= span
+        scaled *= 255
+        normalized = scaled.astype(np.uint8)
 
     colored = cv2.applyColorMap(normalized, _COLORMAP)
 
@@ -223,6 +228,7 @@ class USBThermalCamera(ThermalCamera):
     Requires: pip install opencv-python
     """
 
+    # Y16 counts are centikelvin.
     _KELVIN_SCALE = 100.0
     _KELVIN_OFFSET = 273.15
 
@@ -254,7 +260,12 @@ class USBThermalCamera(ThermalCamera):
         if not ret or raw is None:
             raise RuntimeError("Failed to read frame from USB thermal camera")
         u16 = raw.view(np.uint16).reshape(self._height, self._width)
-        return (u16.astype(np.float32) / self._KELVIN_SCALE) - self._KELVIN_OFFSET
+        # In place on the one float32 copy; same result as the expression
+        # (u16 / scale) - offset without its two temporaries.
+        temps = u16.astype(np.float32)
+        temps /= self._KELVIN_SCALE
+        temps -= self._KELVIN_OFFSET
+        return temps
 
     def close(self) -> None:
         self._cap.release()
@@ -325,6 +336,16 @@ class MLX90641Camera(ThermalCamera):
 # ---------------------------------------------------------------------------
 
 
+# Named camera hints → constructor. Keys are lowercase; open() normalises
+# the hint once and does a single lookup.
+_DRIVERS: Dict[str, Callable[[], ThermalCamera]] = {
+    "sim": SimulatedThermalCamera,
+    "mlx90640": MLX90640Camera,
+    "mlx90641": MLX90641Camera,
+    "usb": lambda: USBThermalCamera(0),
+}
+
+
 class ThermalSource:
     """Factory for opening a thermal camera by type.
 
@@ -339,6 +360,7 @@ class ThermalSource:
             "mlx90641" — MLX90641 16×12 I2C sensor (Raspberry Pi, 3.3V)
             "usb"      — USB thermal camera at device index 0
             <int>      — USB thermal camera at a specific device index
+        Named hints are case-insensitive.
 
     Raises:
         ValueError: If hint is None or unrecognised.
@@ -353,15 +375,13 @@ class ThermalSource:
 
     @staticmethod
     def open(hint: str | int) -> ThermalCamera:
-        if hint == "sim":
-            return SimulatedThermalCamera()
-        if hint == "mlx90640":
-            return MLX90640Camera()
-        if hint == "mlx90641":
-            return MLX90641Camera()
-        if hint == "usb" or isinstance(hint, int):
-            return USBThermalCamera(0 if hint == "usb" else hint)
-        raise ValueError(
-            f"Unknown camera hint {hint!r}. "
-            "Valid options: 'sim', 'mlx90640', 'mlx90641', 'usb', or a device index (int)."
-        )
+        if isinstance(hint, int):
+            return USBThermalCamera(hint)
+        driver = _DRIVERS.get(hint.lower()) if isinstance(hint, str) else None
+        if driver is None:
+            valid = ", ".join(repr(name) for name in _DRIVERS)
+            raise ValueError(
+                f"Unknown camera hint {hint!r}. "
+                f"Valid options: {valid}, or a device index (int)."
+            )
+        return driver()
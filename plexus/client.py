@@ -33,20 +33,20 @@ Usage:
 Note: Requires authentication. Run 'plexus init' or set PLEXUS_API_KEY.
 """
 
-import gzip
+import http.client
 import json
 import logging
 import re
-import shutil
 import socket
-import subprocess
 import threading
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
 from contextlib import contextmanager
 from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
+from plexus import _json
 from plexus._log import _say
 from plexus.buffer import BufferBackend, MemoryBuffer, SqliteBuffer
 from plexus.config import (
@@ -72,11 +72,100 @@ class _Response:
 
 
 class _Session:
+    """Minimal POST-only HTTP client.
+
+    Idle connections are kept open per host so steady-state sends skip the
+    TCP (and TLS) handshake. Targets behind a configured proxy go through
+    urllib instead, since http.client ignores the *_PROXY variables.
+    """
+
+    _MAX_IDLE_PER_HOST = 4
+
     def __init__(self):
         self.headers: Dict[str, str] = {}
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._proxies = urllib.request.getproxies()
 
     def post(self, url: str, data: bytes = b"", headers: Optional[Dict[str, str]] = None, timeout: float = 10.0) -> "_Response":
         req_headers = {**self.headers, **(headers or {})}
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or self._proxied(parts):
+            return self._post_urllib(url, data, req_headers, timeout)
+
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        conn = self._checkout(key, timeout)
+        while True:
+            reused = conn.sock is not None
+            try:
+                conn.request("POST", path, body=data, headers=req_headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except (TimeoutError, socket.timeout) as e:
+                conn.close()
+                raise _Timeout(str(e))
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                conn.close()
+                if reused:
+                    # The server dropped the idle connection; retry once
+                    # on a fresh one before treating it as a failure.
+                    conn = self._connect(key, timeout)
+                    continue
+                raise _ConnError(str(e))
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                raise _ConnError(str(e))
+            break
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        return _Response(resp.status, body.decode("utf-8", errors="replace"))
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _proxied(self, parts: urllib.parse.SplitResult) -> bool:
+        return parts.scheme in self._proxies and not urllib.request.proxy_bypass(
+            parts.hostname or ""
+        )
+
+    def _connect(self, key: Tuple[str, str], timeout: float) -> http.client.HTTPConnection:
+        scheme, netloc = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=timeout)
+        return http.client.HTTPConnection(netloc, timeout=timeout)
+
+    def _checkout(self, key: Tuple[str, str], timeout: float) -> http.client.HTTPConnection:
+        with self._lock:
+            conns = self._idle.get(key)
+            conn = conns.pop() if conns else None
+        if conn is None:
+            return self._connect(key, timeout)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def _checkin(self, key: Tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self._MAX_IDLE_PER_HOST:
+                conns.append(conn)
+                return
+        conn.close()
+
+    @staticmethod
+    def _post_urllib(url: str, data: bytes, req_headers: Dict[str, str], timeout: float) -> "_Response":
         req = urllib.request.Request(url, data=data, headers=req_headers, method="POST")
         try:
             with urllib.request.urlopen(req, timeout=timeout) as resp:
@@ -90,9 +179,6 @@ class _Session:
         except (TimeoutError, socket.timeout) as e:
             raise _Timeout(str(e))
 
-    def close(self) -> None:
-        pass
-
 
 class _Timeout(OSError):
     pass
@@ -109,6 +195,10 @@ _JPEG_SOI = b"\xff\xd8"
 _JPEG_EOI = b"\xff\xd9"
 _FRAME_JPEG_MAX = 750_000  # gateway is 1MB; base64 × 1.33 + envelope ≈ 998KB at this size
 
+# Shared, never mutated: _Session.post merges these into a fresh dict.
+_INGEST_HEADERS = {"Content-Type": "application/json"}
+_INGEST_GZIP_HEADERS = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+
 
 def read_mjpeg_frames(pipe, chunk: int = 65536) -> Generator[bytes, None, None]:
     """Read a raw MJPEG byte stream (e.g. FFmpeg stdout) and yield complete JPEG frames.
@@ -117,23 +207,43 @@ def read_mjpeg_frames(pipe, chunk: int = 65536) -> Generator[bytes, None, None]:
     Useful when building custom FFmpeg pipelines and handing off bytes to
     send_video_frame().
     """
-    buf = b""
+    # read1() returns whatever the pipe has ready; plain read(chunk) on a
+    # buffered pipe blocks until `chunk` bytes arrive, which holds small
+    # frames back until several have piled up.
+    read = getattr(pipe, "read1", None) or pipe.read
+    # bytearray appends in place and drops a consumed prefix without
+    # copying the rest, where bytes += / slicing reallocates every time.
+    buf = bytearray()
+    # Offset where the next EOI search resumes. A large frame arrives over
+    # many reads; without this every read would rescan the frame from its
+    # SOI, which is quadratic in frame size.
+    scan = 0
     while True:
-        data = pipe.read(chunk)
+        data = read(chunk)
         if not data:
             break
         buf += data
         while True:
-            start = buf.find(_JPEG_SOI)
-            if start == -1:
-                buf = b""
-                break
-            end = buf.find(_JPEG_EOI, start + 2)
+            if scan == 0:
+                start = buf.find(_JPEG_SOI)
+                if start == -1:
+                    # Keep a trailing 0xFF — it may be the first half of an SOI.
+                    if buf.endswith(b"\xff"):
+                        del buf[:-1]
+                    else:
+                        buf.clear()
+                    break
+                del buf[:start]  # frame now starts at 0
+                scan = 2
+            end = buf.find(_JPEG_EOI, scan)
             if end == -1:
-                buf = buf[start:]  # keep partial frame
+                # Back up one byte so an EOI split across reads is still found.
+                scan = max(2, len(buf) - 1)
                 break
-            yield buf[start:end + 2]
-            buf = buf[end + 2:]
+            frame = bytes(buf[:end + 2])
+            del buf[:end + 2]
+            scan = 0
+            yield frame
 
 
 class PlexusError(Exception):
@@ -172,6 +282,9 @@ class Plexus:
         timeout: Request timeout in seconds. Default 10s.
         retry_config: Configuration for retry behavior. If None, uses defaults.
         max_buffer_size: Maximum number of points to buffer locally on failures. Default 10000.
+        max_concurrent_commands: Most command handlers allowed to run at once; a
+                 command arriving past the cap is rejected as busy. None removes
+                 the cap. Default 4.
 
     Raises:
         RuntimeError: If not logged in (no API key configured)
@@ -188,6 +301,7 @@ class Plexus:
         persistent_buffer: bool = True,
         buffer_path: Optional[str] = None,
         ws_url: Optional[str] = None,
+        max_concurrent_commands: Optional[int] = 4,
     ):
         self.api_key = api_key or get_api_key()
         if not self.api_key:
@@ -198,6 +312,7 @@ class Plexus:
 
         self.endpoint = (endpoint or get_endpoint()).rstrip("/")
         self.gateway_url = get_gateway_url()
+        self._ingest_url = f"{self.gateway_url}/ingest"
         self.source_id = source_id or get_source_id()
         _validate_source_id(self.source_id)
         self.timeout = timeout
@@ -207,11 +322,16 @@ class Plexus:
         self._run_id: Optional[str] = None
         self._session: Optional[_Session] = None
         self._store_frames: bool = False
-        self._cv2 = None
-        self._pil_image = None  # lazy PIL.Image import
+        self._cv2 = None  # lazy cv2 import; the ImportError once known to be missing
+        self._pil_image = None  # lazy PIL.Image import; the ImportError once known to be missing
+        self._thermal_builder = None  # lazy build_thermal_frame; the ImportError if cv2/numpy missing
         self._fit_warned: bool = False
+        # (stop event, reader thread, ffmpeg process) per stream_camera() call.
+        self._camera_streams: List[Tuple[threading.Event, threading.Thread, Any]] = []
+        self._camera_lock = threading.Lock()
 
         self._ws_url = (ws_url or get_gateway_ws_url())
+        self._max_concurrent_commands = max_concurrent_commands
         self._ws = None  # lazily constructed in _ensure_ws()
         self._clock_offset_ms: int = 0
 
@@ -261,7 +381,8 @@ class Plexus:
             - int/float ms: returned as-is (no offset applied)
         """
         if timestamp is None:
-            return int(time.time() * 1000) + self._clock_offset_ms
+            # Integer clock read — no float multiply/truncate per point.
+            return time.time_ns() // 1_000_000 + self._clock_offset_ms
         # Heuristic: values < 1e12 are seconds
         if timestamp > 0 and timestamp < 1e12:
             return int(timestamp * 1000)
@@ -393,15 +514,18 @@ class Plexus:
                 ("temperature", 22.4),   # uses shared timestamp
             ])
         """
+        # Read the clock once for the whole batch; _make_point normalizes
+        # per-point timestamps itself, so pass those through untouched.
         default_ts_ms = self._normalize_ts_ms(timestamp)
+        make_point = self._make_point
         data_points = []
         for p in points:
             if len(p) == 3:
                 m, v, t = p
-                data_points.append(self._make_point(m, v, self._normalize_ts_ms(t), tags))
+                data_points.append(make_point(m, v, t, tags))
             else:
                 m, v = p
-                data_points.append(self._make_point(m, v, default_ts_ms, tags))
+                data_points.append(make_point(m, v, default_ts_ms, tags))
         return self._send_points(data_points)
 
     def _ensure_ws(self):
@@ -418,6 +542,7 @@ class Plexus:
             agent_version=__version__,
             on_source_id_assigned=self._on_source_id_assigned,
             on_clock_synced=self._on_clock_synced,
+            max_concurrent_commands=self._max_concurrent_commands,
         )
         self._ws.start()
         return self._ws
@@ -484,11 +609,17 @@ class Plexus:
                 import cv2 as _cv2
                 self._cv2 = _cv2
             except ImportError as e:
-                if required:
-                    raise ImportError(
-                        "This frame type requires opencv-python-headless. "
-                        "Install with: pip install plexus-python[video]"
-                    ) from e
+                # Remember the miss — a failed import re-walks every sys.path
+                # entry, and this runs once per frame. Keep the exception: an
+                # installed cv2 can still fail to load (e.g. missing libGL).
+                self._cv2 = e
+        if isinstance(self._cv2, ImportError):
+            if required:
+                raise ImportError(
+                    "This frame type requires opencv-python-headless. "
+                    "Install with: pip install plexus-python[video]"
+                ) from self._cv2
+            return None
         return self._cv2
 
     def _get_pil(self, required: bool = False):
@@ -497,13 +628,30 @@ class Plexus:
                 import PIL.Image as _PILImage
                 self._pil_image = _PILImage
             except ImportError as e:
-                if required:
-                    raise ImportError(
-                        "This frame type requires Pillow. "
-                        "Install with: pip install plexus-python[video]"
-                    ) from e
+                self._pil_image = e
+        if isinstance(self._pil_image, ImportError):
+            if required:
+                raise ImportError(
+                    "This frame type requires Pillow. "
+                    "Install with: pip install plexus-python[video]"
+                ) from self._pil_image
+            return None
         return self._pil_image
 
+    def _get_thermal_builder(self):
+        if self._thermal_builder is None:
+            try:
+                from plexus.cameras.thermal import build_thermal_frame
+                self._thermal_builder = build_thermal_frame
+            except ImportError as e:
+                self._thermal_builder = e
+        if isinstance(self._thermal_builder, ImportError):
+            raise ImportError(
+                "send_thermal_frame requires opencv-python-headless. "
+                "Install with: pip install plexus-python[video]"
+            ) from self._thermal_builder
+        return self._thermal_builder
+
     def _pil_to_jpeg(self, img, quality: int) -> Tuple[bytes, int, int]:
         import io
         if img.mode not in ("RGB", "L"):
@@ -607,20 +755,13 @@ class Plexus:
             timestamp: Unix timestamp in seconds. Defaults to current time.
 
         Returns:
-            True if the frame was sent successfully.
+            True if the frame was queued for sending.
 
         Raises:
             PlexusError: If transport is not 'ws'.
             ImportError: If opencv-python-headless is not installed.
         """
-        try:
-            from plexus.cameras.thermal import build_thermal_frame
-        except ImportError as e:
-            raise ImportError(
-                "send_thermal_frame requires opencv-python-headless. "
-                "Install with: pip install plexus-python[video]"
-            ) from e
-
+        build_thermal_frame = self._get_thermal_builder()
         frame = build_thermal_frame(temps, timestamp_ms=self._normalize_ts_ms(timestamp))
         msg = frame.to_message(
             camera_id=camera_id, source_id=self.source_id, quality=quality
@@ -650,7 +791,8 @@ class Plexus:
             quality: JPEG quality for re-encoded frames, 1-100. Default 85.
 
         Returns:
-            A threading.Event. Call .set() on it to stop streaming.
+            A threading.Event. Call .set() on it to stop streaming;
+            close() stops any streams still running.
 
         Raises:
             PlexusError: If transport is not 'ws' or FFmpeg is not found.
@@ -660,23 +802,29 @@ class Plexus:
             time.sleep(60)
             stop.set()
         """
+        # Only camera streaming shells out — keep these off the import path.
+        import shutil
+        import subprocess
+
         if shutil.which("ffmpeg") is None:
             raise PlexusError(
                 "FFmpeg not found. Install it: https://ffmpeg.org/download.html"
             )
 
         stop_event = threading.Event()
+        cmd = [
+            "ffmpeg", "-loglevel", "error",
+            "-i", url,
+            "-vf", f"fps={fps}",
+            "-f", "image2pipe",
+            "-vcodec", "mjpeg",
+            "pipe:1",
+        ]
+        # Spawned here rather than in the thread so close() always has a
+        # process to terminate — that is what unblocks a stalled read.
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
         def _run():
-            cmd = [
-                "ffmpeg", "-loglevel", "error",
-                "-i", url,
-                "-vf", f"fps={fps}",
-                "-f", "image2pipe",
-                "-vcodec", "mjpeg",
-                "pipe:1",
-            ]
-            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
             try:
                 for jpeg in read_mjpeg_frames(proc.stdout):
                     if stop_event.is_set():
@@ -689,8 +837,13 @@ class Plexus:
                 proc.terminate()
                 proc.wait()
 
-        t = threading.Thread(target=_run, daemon=True)
+        t = threading.Thread(target=_run, name="plexus-camera", daemon=True)
         t.start()
+        with self._camera_lock:
+            self._camera_streams = [
+                entry for entry in self._camera_streams if entry[1].is_alive()
+            ]
+            self._camera_streams.append((stop_event, t, proc))
         return stop_event
 
     def on_command(
@@ -736,8 +889,13 @@ class Plexus:
                 "No API key configured. Run 'plexus init' or set PLEXUS_API_KEY"
             )
 
-        # Include any previously buffered points
-        all_points = self._get_buffered_points() + points
+        # Include any previously buffered points. Only touch the buffer again
+        # on success if there was something in it — for SqliteBuffer a clear
+        # is a DELETE + commit, which would otherwise run on every send.
+        buffered = self._get_buffered_points()
+        all_points = buffered + points if buffered else points
+        if not all_points:
+            return True
 
         # Preferred path: WebSocket.
         ws = self._ensure_ws()
@@ -746,32 +904,26 @@ class Plexus:
         if not ws.is_authenticated:
             ws.wait_authenticated(timeout=min(self.timeout, 5.0))
         if ws.send_points(all_points):
-            self._clear_buffer()
+            if buffered:
+                self._clear_buffer()
             self._note_send(len(all_points), via="ws")
             return True
         # Socket unavailable → fall through to HTTP.
         if not self._announced_http_fallback:
             _say(
-                f"⚠ WebSocket unavailable, falling back to POST {self.gateway_url}/ingest"
+                f"⚠ WebSocket unavailable, falling back to POST {self._ingest_url}"
             )
             self._announced_http_fallback = True
 
-        url = f"{self.gateway_url}/ingest"
+        url = self._ingest_url
         last_error: Optional[Exception] = None
 
+        # Serialize (and compress) once — the body is identical on every
+        # retry attempt, so there's no reason to re-encode it per attempt.
+        body, headers = self._encode_ingest_body(all_points)
+
         for attempt in range(self.retry_config.max_retries + 1):
             try:
-                payload = json.dumps({"source_id": self.source_id, "points": all_points})
-                payload_bytes = payload.encode("utf-8")
-
-                # Gzip compress payloads > 1KB for bandwidth efficiency
-                if len(payload_bytes) > 1024:
-                    body = gzip.compress(payload_bytes, compresslevel=6)
-                    headers = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
-                else:
-                    body = payload_bytes
-                    headers = {"Content-Type": "application/json"}
-
                 response = self._get_session().post(
                     url,
                     data=body,
@@ -814,7 +966,8 @@ class Plexus:
 
                 # Success - clear the buffer and return
                 elif response.status_code < 400:
-                    self._clear_buffer()
+                    if buffered:
+                        self._clear_buffer()
                     self._note_send(len(all_points), via="http")
                     return True
 
@@ -851,6 +1004,19 @@ class Plexus:
             raise last_error
         raise PlexusError("Send failed after all retries")
 
+    def _encode_ingest_body(
+        self, points: List[Dict[str, Any]]
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """Encode an /ingest request body. Payloads over 1KB are gzipped."""
+        payload_bytes = _json.dumps(
+            {"source_id": self.source_id, "points": points}
+        ).encode("utf-8")
+        if len(payload_bytes) > 1024:
+            import gzip
+            body = gzip.compress(payload_bytes, compresslevel=6)
+            return body, _INGEST_GZIP_HEADERS
+        return payload_bytes, _INGEST_HEADERS
+
     def _note_send(self, count: int, via: str) -> None:
         """Bookkeeping so the user sees the moment data starts flowing.
 
@@ -965,6 +1131,19 @@ class Plexus:
 
     def close(self):
         """Close the client, flush any buffered points, and release resources."""
+        # Stop camera streams first so they can't lazily reopen the socket
+        # we're about to tear down. Terminating FFmpeg closes its stdout,
+        # which releases a reader blocked on a stalled source.
+        with self._camera_lock:
+            streams, self._camera_streams = self._camera_streams, []
+        for stop_event, _, proc in streams:
+            stop_event.set()
+            try:
+                proc.terminate()
+            except OSError:
+                pass  # already exited
+        for _, t, _ in streams:
+            t.join(timeout=2.0)
         if self.buffer_size() > 0:
             try:
                 self.flush_buffer()
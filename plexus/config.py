@@ -9,7 +9,7 @@ import os
 import random
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 
 @dataclass
@@ -63,22 +63,40 @@ def get_config_path() -> Path:
     return CONFIG_FILE
 
 
+# Last parsed config, keyed by (path, mtime_ns, size). A single Plexus()
+# construction calls several get_* helpers, each of which used to re-open and
+# re-parse the file; now an unchanged file costs one stat().
+_config_cache: Optional[Tuple[Tuple[str, int, int], dict]] = None
+
+
 def load_config() -> dict:
     """Load config from file, creating defaults if needed."""
-    if not CONFIG_FILE.exists():
+    global _config_cache
+    try:
+        st = CONFIG_FILE.stat()
+    except OSError:
         return DEFAULT_CONFIG.copy()
 
+    key = (str(CONFIG_FILE), st.st_mtime_ns, st.st_size)
+    cached = _config_cache
+    if cached is not None and cached[0] == key:
+        return dict(cached[1])
+
     try:
         with open(CONFIG_FILE, "r") as f:
             config = json.load(f)
-            # Merge with defaults to handle missing keys
-            return {**DEFAULT_CONFIG, **config}
     except (json.JSONDecodeError, IOError):
         return DEFAULT_CONFIG.copy()
+    # Merge with defaults to handle missing keys
+    merged = {**DEFAULT_CONFIG, **config}
+    _config_cache = (key, merged)
+    return dict(merged)
 
 
 def save_config(config: dict) -> None:
     """Save config to file."""
+    global _config_cache
+    _config_cache = None
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     try:
         os.chmod(CONFIG_DIR, 0o700)
@@ -14,7 +14,7 @@ authoritative: if the gateway auto-suffixed on a collision (e.g. the
 desired name was already claimed by a different install_id), the
 client's `source_id` is updated in place to match.
     client → {"type": "telemetry", "points": [...]}
-    client → {"type": "heartbeat", "source_id": ..., "agent_version": ...}   # every 30s
+    client → {"type": "heartbeat", "source_id": ..., "agent_version": ...}   # after 30s idle
     server → {"type": "typed_command", "id": ..., "command": ..., "params": {...}}
     client → {"type": "command_result", "id": ..., "command": ..., "event": "ack"}
     client → {"type": "command_result", "id": ..., "command": ...,
@@ -26,7 +26,7 @@ Runs the read loop on a background daemon thread so callers can stay sync.
 from __future__ import annotations
 
 import atexit
-import json
+import functools
 import logging
 import queue
 import random
@@ -34,7 +34,7 @@ import struct
 import threading
 import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 try:
     import websocket  # websocket-client
@@ -44,19 +44,26 @@ except ImportError as e:  # pragma: no cover - import-time failure is obvious
         "Install with: pip install websocket-client"
     ) from e
 
+from plexus import _json
 from plexus._log import _say
 
 logger = logging.getLogger(__name__)
 
 AUTH_TIMEOUT_S = 10.0
 HEARTBEAT_INTERVAL_S = 30.0
+RECV_POLL_S = 1.0
 BACKOFF_BASE_S = 1.0
 BACKOFF_MAX_S = 60.0
+MAX_CONCURRENT_COMMANDS = 4
+
+# Constant head of every telemetry frame; the points array and closing brace
+# are appended per send. Matches _json.dumps({"type": "telemetry", "points": ...}).
+_TELEMETRY_PREFIX = '{"type":"telemetry","points":'
 
 CommandHandler = Callable[[str, Dict[str, Any]], Optional[Dict[str, Any]]]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _RegisteredCommand:
     name: str
     handler: CommandHandler
@@ -95,11 +102,14 @@ class WebSocketTransport:
         auto_reconnect: bool = True,
         on_source_id_assigned: Optional[Callable[[str], None]] = None,
         on_clock_synced: Optional[Callable[[int], None]] = None,
+        max_concurrent_commands: Optional[int] = MAX_CONCURRENT_COMMANDS,
     ):
         if not api_key:
             raise ValueError("api_key required")
         if not source_id:
             raise ValueError("source_id required")
+        if max_concurrent_commands is not None and max_concurrent_commands < 1:
+            raise ValueError("max_concurrent_commands must be >= 1 or None")
 
         self.api_key = api_key
         self.source_id = source_id
@@ -119,8 +129,30 @@ class WebSocketTransport:
         self._thread: Optional[threading.Thread] = None
         self._backoff_attempt = 0
         self._clock_offset_ms: int = 0
-        self._video_queue: "queue.Queue[bytes]" = queue.Queue(maxsize=2)
+        self._last_send_at = 0.0  # time.monotonic() of the last outbound frame
+        self._video_queue: "queue.Queue[Union[bytes, str]]" = queue.Queue(maxsize=2)
         self._video_thread: Optional[threading.Thread] = None
+        self._video_dropped = 0
+        # Caps handlers running at once (None = no cap); a command past the
+        # cap is refused with a "busy" error rather than acked and dropped.
+        self._max_concurrent_commands = max_concurrent_commands
+        self._command_slots: Optional[threading.BoundedSemaphore] = (
+            threading.BoundedSemaphore(max_concurrent_commands)
+            if max_concurrent_commands is not None
+            else None
+        )
+        # Inbound message type → handler, bound once rather than walked as an
+        # if/elif chain per frame. Unknown types are ignored (forward-compat).
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            "typed_command": self._handle_command,
+            "error": self._handle_server_error,
+        }
+        # Bumped by register_command; keys the auth cache together with
+        # source_id so a frame built mid-registration is never reused.
+        self._commands_version = 0
+        # ((source_id, commands_version), encoded device_auth) — reused
+        # across reconnects.
+        self._auth_cache: Optional[Tuple[Tuple[str, int], str]] = None
 
     # ------------------------------------------------------------------ public
 
@@ -137,6 +169,7 @@ class WebSocketTransport:
         self._commands[name] = _RegisteredCommand(
             name=name, handler=handler, description=description, params=params or []
         )
+        self._commands_version += 1
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
@@ -184,8 +217,9 @@ class WebSocketTransport:
             return True
         if not self._authenticated.is_set():
             return False
-        frame = {"type": "telemetry", "points": points}
-        return self._send_frame(frame)
+        # Splice the encoded points into a constant envelope rather than
+        # building and re-encoding a wrapper dict on every send.
+        return self._send_text(_TELEMETRY_PREFIX + _json.dumps(points) + "}")
 
     def send_video_frame_async(
         self,
@@ -196,25 +230,47 @@ class WebSocketTransport:
         height: int,
         timestamp_ms: int,
     ) -> bool:
-        """Encode and enqueue a binary video frame. Non-blocking — drops the
-        frame if the queue is full rather than blocking the caller."""
+        """Encode and enqueue a binary video frame. Non-blocking — if the
+        uplink is behind, the oldest queued frame is dropped to make room."""
         if not self._authenticated.is_set():
             return False
         payload = _encode_binary_video_frame(
             source_id, camera_id, jpeg_bytes, width, height, timestamp_ms
         )
-        try:
-            self._video_queue.put_nowait(payload)
-            return True
-        except queue.Full:
-            return False
+        return self._enqueue_video(payload)
 
     def send_json_video_frame(self, msg: Dict[str, Any]) -> bool:
-        """Send a JSON video_frame message. Used for frames that carry extra
-        metadata (e.g. thermal cameras) that the binary format cannot express."""
+        """Encode and enqueue a JSON video_frame message. Used for frames that
+        carry extra metadata (e.g. thermal cameras) that the binary format
+        cannot express. Shares the video queue with binary frames so a single
+        thread writes all video, with the same drop-oldest behaviour."""
         if not self._authenticated.is_set():
             return False
-        return self._send_frame(msg)
+        return self._enqueue_video(_json.dumps(msg))
+
+    def _enqueue_video(self, payload: Union[bytes, str]) -> bool:
+        # A stale frame is worth less than the current one, so when the queue
+        # is full evict from the head rather than refusing the new frame.
+        for _ in range(2):
+            try:
+                self._video_queue.put_nowait(payload)
+                return True
+            except queue.Full:
+                pass
+            try:
+                self._video_queue.get_nowait()
+            except queue.Empty:
+                continue
+            self._note_video_drop()
+        self._note_video_drop()
+        return False
+
+    def _note_video_drop(self) -> None:
+        self._video_dropped += 1
+        if self._video_dropped == 1:
+            _say("⚠ Video uplink is behind, dropping oldest frames.")
+        else:
+            logger.debug("plexus video frames dropped: %d", self._video_dropped)
 
     # ------------------------------------------------------------------ thread
 
@@ -251,7 +307,8 @@ class WebSocketTransport:
                 break
 
     def _video_sender_loop(self) -> None:
-        """Drain _video_queue and send binary WebSocket frames.
+        """Drain _video_queue and send video frames — bytes as binary
+        WebSocket frames, str (JSON video_frame messages) as text.
 
         Runs on a dedicated thread so slow sends never block the caller.
         Drops frames during reconnect rather than queuing stale video.
@@ -268,29 +325,28 @@ class WebSocketTransport:
             if ws is None:
                 continue
             try:
-                ws.send_binary(payload)
+                if isinstance(payload, bytes):
+                    ws.send_binary(payload)
+                else:
+                    ws.send(payload)
+                self._last_send_at = time.monotonic()
             except Exception as e:
                 logger.debug("plexus video send failed: %s", e)
 
     def _connect_and_serve(self) -> None:
-        ws = websocket.create_connection(self.ws_url, timeout=AUTH_TIMEOUT_S)
+        # Inbound frames are JSON and go straight to json.loads, which rejects
+        # malformed input anyway — skip websocket-client's pure-Python UTF-8
+        # validator (the dominant per-frame recv cost without wsaccel).
+        ws = websocket.create_connection(
+            self.ws_url, timeout=AUTH_TIMEOUT_S, skip_utf8_validation=True
+        )
         with self._ws_lock:
             self._ws = ws
 
         # 1. Send device_auth
         desired_source_id = self.source_id
-        auth = {
-            "type": "device_auth",
-            "api_key": self.api_key,
-            "source_id": desired_source_id,
-            "platform": self.platform,
-            "agent_version": self.agent_version,
-        }
-        if self.install_id:
-            auth["install_id"] = self.install_id
-        if self._commands:
-            auth["commands"] = [c.to_manifest() for c in self._commands.values()]
-        ws.send(json.dumps(auth))
+        ws.send(self._auth_payload())
+        self._last_send_at = time.monotonic()
 
         # 2. Wait for authenticated
         ws.settimeout(AUTH_TIMEOUT_S)
@@ -337,43 +393,80 @@ class WebSocketTransport:
         else:
             _say(f"✓ Connected to gateway as {self.source_id}")
 
-        # 3. Read loop with heartbeat pump
-        ws.settimeout(1.0)
-        last_heartbeat = time.monotonic()
+        # 3. Read loop with heartbeat pump. Heartbeats run off a fixed
+        # deadline rather than "interval since last send" so recv latency
+        # doesn't accumulate into drift; the recv timeout is clamped to the
+        # next deadline so the beat fires on time. Any outbound frame proves
+        # liveness, so while the app is streaming the beat is pushed back to
+        # one interval after the latest send and never goes out.
+        # source_id is settled by now, so the frame is encoded once per
+        # connection rather than on every beat.
+        heartbeat = _json.dumps({
+            "type": "heartbeat",
+            "source_id": self.source_id,
+            "agent_version": self.agent_version,
+        })
+        next_heartbeat = time.monotonic() + HEARTBEAT_INTERVAL_S
         while not self._stop.is_set():
             now = time.monotonic()
-            if now - last_heartbeat >= HEARTBEAT_INTERVAL_S:
-                self._send_frame({
-                    "type": "heartbeat",
-                    "source_id": self.source_id,
-                    "agent_version": self.agent_version,
-                })
-                last_heartbeat = now
+            if now >= next_heartbeat:
+                quiet_until = self._last_send_at + HEARTBEAT_INTERVAL_S
+                if quiet_until > now:
+                    next_heartbeat = quiet_until
+                else:
+                    self._send_text(heartbeat)
+                    next_heartbeat += HEARTBEAT_INTERVAL_S
+                if next_heartbeat <= now:
+                    # Fell a whole interval behind (host suspend, long GC) —
+                    # resync instead of bursting catch-up heartbeats.
+                    logger.debug("plexus ws heartbeat schedule resynced")
+                    next_heartbeat = now + HEARTBEAT_INTERVAL_S
+            ws.settimeout(min(RECV_POLL_S, max(0.01, next_heartbeat - now)))
 
             try:
-                raw = ws.recv()
+                # recv_data() hands back the raw payload bytes; recv() would
+                # decode text frames to str only for json.loads to re-scan them.
+                opcode, raw = ws.recv_data()
             except websocket.WebSocketTimeoutException:
                 continue
             except (websocket.WebSocketConnectionClosedException, OSError):
                 logger.info("plexus ws closed")
                 return
 
+            if opcode == websocket.ABNF.OPCODE_CLOSE:
+                logger.info("plexus ws closed by server")
+                return
             if not raw:
                 continue
             self._dispatch(_safe_json(raw))
 
     def _dispatch(self, msg: Dict[str, Any]) -> None:
         mtype = msg.get("type")
-        if mtype == "typed_command":
-            self._handle_command(msg)
-        elif mtype == "error":
-            logger.warning("plexus ws server error: %s", msg.get("detail") or msg)
-        # ignore unknown types — forward-compat
+        handler = self._handlers.get(mtype) if isinstance(mtype, str) else None
+        if handler is not None:
+            handler(msg)
+
+    def _handle_server_error(self, msg: Dict[str, Any]) -> None:
+        logger.warning("plexus ws server error: %s", msg.get("detail") or msg)
 
     def _handle_command(self, msg: Dict[str, Any]) -> None:
         cmd_id = msg.get("id") or ""
         command = msg.get("command") or ""
         params = msg.get("params") or {}
+        reg = self._commands.get(command)
+
+        # Claim a handler slot before acking, so a refused command is never
+        # acked.
+        slots = self._command_slots
+        if reg is not None and slots is not None and not slots.acquire(blocking=False):
+            self._send_frame({
+                "type": "command_result",
+                "id": cmd_id,
+                "command": command,
+                "event": "error",
+                "error": f"busy: {self._max_concurrent_commands} commands already running",
+            })
+            return
 
         # Ack immediately (matches C SDK: plexus_ws.c:275-280)
         self._send_frame({
@@ -383,7 +476,6 @@ class WebSocketTransport:
             "event": "ack",
         })
 
-        reg = self._commands.get(command)
         if reg is None:
             self._send_frame({
                 "type": "command_result",
@@ -395,12 +487,25 @@ class WebSocketTransport:
             return
 
         # Run the handler off the read-loop thread so a slow handler doesn't
-        # block heartbeats or other inbound frames.
-        threading.Thread(
-            target=self._run_handler,
-            args=(reg, cmd_id, command, params),
-            daemon=True,
-        ).start()
+        # block heartbeats or other inbound frames. Daemon threads so a
+        # long-running handler never holds up interpreter exit.
+        try:
+            threading.Thread(
+                target=self._run_handler,
+                args=(reg, cmd_id, command, params),
+                name="plexus-cmd",
+                daemon=True,
+            ).start()
+        except RuntimeError as e:  # can't start new thread
+            if slots is not None:
+                slots.release()
+            self._send_frame({
+                "type": "command_result",
+                "id": cmd_id,
+                "command": command,
+                "event": "error",
+                "error": str(e),
+            })
 
     def _run_handler(
         self,
@@ -420,6 +525,9 @@ class WebSocketTransport:
                 "error": str(e),
             })
             return
+        finally:
+            if self._command_slots is not None:
+                self._command_slots.release()
         self._send_frame({
             "type": "command_result",
             "id": cmd_id,
@@ -428,13 +536,42 @@ class WebSocketTransport:
             "result": result if result is not None else {},
         })
 
+    def _auth_payload(self) -> str:
+        """Encoded device_auth frame. Built once and reused on every
+        reconnect until a command is registered or source_id changes."""
+        # Read the key before the inputs: a command registered while this
+        # runs leaves the stored key behind, so the next call rebuilds.
+        key = (self.source_id, self._commands_version)
+        cached = self._auth_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        commands = list(self._commands.values())
+        auth = {
+            "type": "device_auth",
+            "api_key": self.api_key,
+            "source_id": key[0],
+            "platform": self.platform,
+            "agent_version": self.agent_version,
+        }
+        if self.install_id:
+            auth["install_id"] = self.install_id
+        if commands:
+            auth["commands"] = [c.to_manifest() for c in commands]
+        payload = _json.dumps(auth)
+        self._auth_cache = (key, payload)
+        return payload
+
     def _send_frame(self, frame: Dict[str, Any]) -> bool:
+        return self._send_text(_json.dumps(frame))
+
+    def _send_text(self, payload: str) -> bool:
         with self._ws_lock:
             ws = self._ws
         if ws is None:
             return False
         try:
-            ws.send(json.dumps(frame))
+            ws.send(payload)
+            self._last_send_at = time.monotonic()
             return True
         except Exception as e:
             logger.debug("plexus ws send failed: %s", e)
@@ -444,6 +581,19 @@ class WebSocketTransport:
 # --------------------------------------------------------------------- helpers
 
 
+# width, height, timestamp_ms — the only per-frame fields in the header.
+_VIDEO_FRAME_FIELDS = struct.Struct(">IIq")
+
+
+@functools.lru_cache(maxsize=64)
+def _video_frame_prefix(source_id: str, camera_id: str) -> bytes:
+    """Version byte plus the length-prefixed ids. Invariant for a stream, so
+    it is built once per (source_id, camera_id) instead of every frame."""
+    src = source_id.encode("utf-8")[:255]
+    cam = camera_id.encode("utf-8")[:255]
+    return bytes([0x01, len(src)]) + src + bytes([len(cam)]) + cam
+
+
 def _encode_binary_video_frame(
     source_id: str,
     camera_id: str,
@@ -465,14 +615,11 @@ def _encode_binary_video_frame(
         [timestamp_ms]  8 bytes  int64  big-endian
         [jpeg_bytes]    rest
     """
-    src = source_id.encode("utf-8")[:255]
-    cam = camera_id.encode("utf-8")[:255]
-    header = (
-        bytes([0x01, len(src)]) + src
-        + bytes([len(cam)]) + cam
-        + struct.pack(">IIq", width, height, timestamp_ms)
-    )
-    return header + jpeg_bytes
+    return b"".join((
+        _video_frame_prefix(source_id, camera_id),
+        _VIDEO_FRAME_FIELDS.pack(width, height, timestamp_ms),
+        jpeg_bytes,
+    ))
 
 
 def _ensure_device_path(url: str) -> str:
@@ -483,13 +630,13 @@ def _ensure_device_path(url: str) -> str:
 
 
 def _safe_json(raw: Any) -> Dict[str, Any]:
-    if isinstance(raw, (bytes, bytearray)):
-        raw = raw.decode("utf-8", errors="replace")
-    if not isinstance(raw, str):
+    # json.loads accepts bytes directly and detects the encoding itself, so
+    # binary payloads are parsed without an intermediate str copy.
+    if not isinstance(raw, (str, bytes, bytearray)):
         return {}
     try:
-        obj = json.loads(raw)
-    except json.JSONDecodeError:
+        obj = _json.loads(raw)
+    except ValueError:  # JSONDecodeError, or UnicodeDecodeError on bad bytes
         return {}
     return obj if isinstance(obj, dict) else {}
 
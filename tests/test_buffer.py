@@ -1,6 +1,9 @@
 """Tests for plexus.buffer — MemoryBuffer and SqliteBuffer backends."""
 
+import json
+import math
 import os
+import sqlite3
 import tempfile
 
 
@@ -143,3 +146,51 @@ class TestSqliteBuffer(BufferTests):
             buf2.close()
         finally:
             os.unlink(tmp.name)
+
+    def test_reads_rows_with_bare_nan(self):
+        """Rows written by the stdlib encoder (bare NaN) still load."""
+        tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        tmp.close()
+
+        try:
+            SqliteBuffer(path=tmp.name, max_size=1000).close()
+            conn = sqlite3.connect(tmp.name)
+            conn.execute(
+                "INSERT INTO points (data) VALUES (?)",
+                (json.dumps({"metric": "temp", "value": float("nan")}),),
+            )
+            conn.commit()
+            conn.close()
+
+            buf = SqliteBuffer(path=tmp.name, max_size=1000)
+            points = buf.get_all()
+            assert len(points) == 1
+            assert math.isnan(points[0]["value"])
+            points, remaining = buf.drain()
+            assert math.isnan(points[0]["value"])
+            assert remaining == 0
+            buf.close()
+        finally:
+            os.unlink(tmp.name)
+
+    def test_get_all_sees_points_added_by_another_instance(self):
+        """Instances sharing a file (e.g. two processes) see each other's rows."""
+        tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        tmp.close()
+
+        try:
+            reader = SqliteBuffer(path=tmp.name, max_size=1000)
+            writer = SqliteBuffer(path=tmp.name, max_size=1000)
+            assert reader.get_all() == []
+
+            writer.add(_make_points(3))
+            assert reader.get_all() == _make_points(3)
+
+            reader.clear()
+            assert reader.get_all() == []
+            writer.add(_make_points(2, offset=10))
+            assert reader.get_all() == _make_points(2, offset=10)
+            reader.close()
+            writer.close()
+        finally:
+            os.unlink(tmp.name)
@@ -45,3 +45,40 @@ class TestConfigPermissions:
 
         assert loaded["api_key"] == "plx_test123"
         assert loaded["source_id"] == "src-1"
+
+
+class TestConfigCache:
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        config_dir = tmp_path / ".plexus"
+        config_file = config_dir / "config.json"
+
+        with patch("plexus.config.CONFIG_DIR", config_dir), \
+             patch("plexus.config.CONFIG_FILE", config_file):
+            save_config({"api_key": "plx_test123"})
+            assert load_config()["api_key"] == "plx_test123"
+            with patch("plexus.config.json.load") as mock_load:
+                loaded = load_config()
+            mock_load.assert_not_called()
+            assert loaded["api_key"] == "plx_test123"
+
+    def test_returned_config_is_a_copy(self, tmp_path):
+        config_dir = tmp_path / ".plexus"
+        config_file = config_dir / "config.json"
+
+        with patch("plexus.config.CONFIG_DIR", config_dir), \
+             patch("plexus.config.CONFIG_FILE", config_file):
+            save_config({"api_key": "plx_test123"})
+            load_config()["api_key"] = "mutated"
+            assert load_config()["api_key"] == "plx_test123"
+
+    def test_save_invalidates_cache(self, tmp_path):
+        config_dir = tmp_path / ".plexus"
+        config_file = config_dir / "config.json"
+
+        with patch("plexus.config.CONFIG_DIR", config_dir), \
+             patch("plexus.config.CONFIG_FILE", config_file):
+            save_config({"api_key": "plx_aaaaaaa"})
+            load_config()
+            # Same size, possibly same mtime on coarse filesystems.
+            save_config({"api_key": "plx_bbbbbbb"})
+            assert load_config()["api_key"] == "plx_bbbbbbb"
@@ -0,0 +1,35 @@
+"""Tests for plexus._json — the shared wire encoder."""
+
+import json
+import math
+
+from plexus import _json
+
+
+def test_dumps_is_compact_and_roundtrips():
+    point = {"metric": "temp", "value": 72.5, "tags": {"zone": "a"}, "timestamp": 1700000000000}
+    encoded = _json.dumps(point)
+    assert isinstance(encoded, str)
+    assert " " not in encoded
+    assert json.loads(encoded) == point
+    assert _json.loads(encoded) == point
+    assert _json.loads(encoded.encode("utf-8")) == point
+
+
+def test_dumps_handles_values_outside_fast_path():
+    # Wider than 64 bits and non-str keys — orjson rejects both, the stdlib
+    # fallback must still encode them.
+    assert json.loads(_json.dumps({"v": 2**70})) == {"v": 2**70}
+    assert json.loads(_json.dumps({1: "a"})) == {"1": "a"}
+
+
+def test_loads_accepts_stdlib_nan_and_infinity():
+    decoded = _json.loads(json.dumps({"a": float("nan"), "b": float("inf")}))
+    assert math.isnan(decoded["a"])
+    assert decoded["b"] == float("inf")
+
+
+def test_fallback_encoding_roundtrips_non_finite_floats():
+    # Non-str keys force the stdlib fallback; its output must still load.
+    value = _json.loads(_json.dumps({"v": {1: float("nan")}}))["v"]["1"]
+    assert value is None or math.isnan(value)
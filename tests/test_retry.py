@@ -1,10 +1,12 @@
 """Tests for retry and buffering functionality."""
 
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from plexus.client import AuthenticationError, Plexus, PlexusError, _ConnError, _Timeout
+from plexus.client import AuthenticationError, Plexus, PlexusError, _ConnError, _Session, _Timeout
 from plexus.config import RetryConfig
 
 
@@ -312,6 +314,19 @@ class TestBuffering:
             assert result is True
             assert client.buffer_size() == 0
 
+    def test_steady_state_send_does_not_clear_empty_buffer(self, client):
+        """A successful send with nothing buffered must not clear the buffer."""
+        ws = MagicMock()
+        ws.is_authenticated = True
+        ws.send_points.return_value = True
+        client._ws = ws
+
+        with patch.object(client._buffer, "clear") as mock_clear:
+            assert client.send("temp", 72.5) is True
+            assert client.send("temp", 73.0) is True
+        mock_clear.assert_not_called()
+        assert ws.send_points.call_count == 2
+
 
 class TestThreadSafety:
     """Tests for thread-safe buffer access."""
@@ -356,3 +371,52 @@ class TestThreadSafety:
         assert len(errors) == 0
         # All points should be buffered (though exact count may vary due to timing)
         assert client.buffer_size() > 0
+
+
+class TestSessionKeepAlive:
+    """Tests for connection reuse in the HTTP session."""
+
+    @pytest.fixture
+    def server(self):
+        peers = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                peers.append(self.client_address)
+                body = b'{"ok":true}'
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", peers
+        httpd.shutdown()
+        httpd.server_close()
+
+    def test_reuses_connection(self, server):
+        url, peers = server
+        session = _Session()
+        session._proxies = {}  # ignore any proxy configured on the test host
+        try:
+            for _ in range(3):
+                resp = session.post(url + "/api/ingest", data=b"{}", timeout=2.0)
+                assert resp.status_code == 200
+                assert resp.text == '{"ok":true}'
+        finally:
+            session.close()
+        assert len(peers) == 3
+        assert len(set(peers)) == 1
+
+    def test_connection_refused_raises_conn_error(self):
+        session = _Session()
+        with pytest.raises(_ConnError):
+            session.post("http://127.0.0.1:9/api/ingest", data=b"{}", timeout=1.0)
@@ -12,6 +12,7 @@ pytest.importorskip("cv2")
 from plexus.cameras.thermal import (  # noqa: E402
     SimulatedThermalCamera,
     ThermalFrame,
+    ThermalSource,
     _upscale_size,
     build_thermal_frame,
     encode_frame,
@@ -100,6 +101,27 @@ class TestBuildThermalFrame:
         assert frame.temp_min == 25.0
         assert frame.temp_max == 25.0
 
+    def test_extremes_map_to_full_colormap_range(self, monkeypatch):
+        import plexus.cameras.thermal as thermal
+
+        seen = []
+        apply = thermal.cv2.applyColorMap
+        monkeypatch.setattr(
+            thermal.cv2, "applyColorMap", lambda img, cmap: seen.append(img) or apply(img, cmap)
+        )
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            lo, hi = sorted(rng.uniform(-40.0, 300.0, size=2))
+            temps = rng.uniform(lo, hi, size=(24, 32)).astype(np.float32)
+            temps.flat[0], temps.flat[1] = lo, hi
+            build_thermal_frame(temps)
+            assert seen[-1].min() == 0
+            assert seen[-1].max() == 255
+            # Bit-for-bit the original (temps - min) / span * 255 mapping.
+            t_min, t_max = float(temps.min()), float(temps.max())
+            expected = ((temps - t_min) / (t_max - t_min) * 255).astype(np.uint8)
+            assert np.array_equal(seen[-1], expected)
+
 
 class TestToMessage:
     def _msg(self, **kwargs):
@@ -151,3 +173,22 @@ def test_encode_frame_reads_camera():
     assert frame.sensor_width == 32
     assert frame.sensor_height == 24
     assert frame.temps is not None
+
+
+# ---------------------------------------------------------------------------
+# ThermalSource.open — hint dispatch
+# ---------------------------------------------------------------------------
+
+
+class TestThermalSourceOpen:
+    def test_sim_hint_is_case_insensitive(self):
+        assert isinstance(ThermalSource.open("sim"), SimulatedThermalCamera)
+        assert isinstance(ThermalSource.open("SIM"), SimulatedThermalCamera)
+
+    def test_unknown_hint_lists_valid_options(self):
+        with pytest.raises(ValueError, match="'sim', 'mlx90640', 'mlx90641', 'usb'"):
+            ThermalSource.open("flir")
+
+    def test_none_hint_rejected(self):
+        with pytest.raises(ValueError):
+            ThermalSource.open(None)
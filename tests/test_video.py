@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import io
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -22,6 +24,7 @@ def _bare_client():
     px = Plexus.__new__(Plexus)
     px._cv2 = None
     px._pil_image = None
+    px._thermal_builder = None
     px._fit_warned = False
     return px
 
@@ -131,6 +134,35 @@ class TestReadMjpegFrames:
         frames = list(read_mjpeg_frames(_make_pipe(stream)))
         assert frames == []
 
+    def test_yields_frame_without_waiting_for_full_chunk(self):
+        # A live pipe hands back what is ready; the first frame must come
+        # out before the reader asks for more.
+        class _LivePipe:
+            def __init__(self):
+                self.reads = 0
+
+            def read1(self, n):
+                self.reads += 1
+                return _TINY_JPEG if self.reads == 1 else b""
+
+            def read(self, n):
+                raise AssertionError("read() would block for a full chunk")
+
+        pipe = _LivePipe()
+        frames = read_mjpeg_frames(pipe)
+        assert next(frames) == _TINY_JPEG
+        assert pipe.reads == 1
+
+    def test_markers_split_across_reads(self):
+        # Every marker byte pair straddles a read boundary at chunk=1.
+        stream = b"junk\xff" + _TINY_JPEG + _TINY_JPEG
+        frames = list(read_mjpeg_frames(_make_pipe(stream), chunk=1))
+        assert frames == [_TINY_JPEG, _TINY_JPEG]
+
+    def test_frames_are_bytes(self):
+        frames = list(read_mjpeg_frames(_make_pipe(_TINY_JPEG + _TINY_JPEG), chunk=7))
+        assert [type(f) for f in frames] == [bytes, bytes]
+
     def test_many_frames(self):
         stream = _TINY_JPEG * 100
         frames = list(read_mjpeg_frames(_make_pipe(stream), chunk=32))
@@ -206,3 +238,110 @@ class TestFitToWire:
             mp.setitem(__import__("sys").modules, "PIL.Image", None)
             result = px._fit_to_wire(fake, requested_quality=95)
         assert result is fake
+
+
+# ---------------------------------------------------------------------------
+# _get_cv2 / _get_pil — import caching
+# ---------------------------------------------------------------------------
+
+class TestOptionalImportCache:
+    def test_missing_cv2_is_remembered(self):
+        px = _bare_client()
+        with pytest.MonkeyPatch().context() as mp:
+            mp.setitem(__import__("sys").modules, "cv2", None)
+            assert px._get_cv2() is None
+            # Even if cv2 became importable, the cached miss is not re-probed.
+            mp.setitem(__import__("sys").modules, "cv2", MagicMock())
+            assert px._get_cv2() is None
+            with pytest.raises(ImportError, match="opencv-python-headless") as exc:
+                px._get_cv2(required=True)
+            # The original failure (e.g. a missing libGL) stays attached.
+            assert isinstance(exc.value.__cause__, ImportError)
+
+    def test_missing_pil_raises_when_required(self):
+        px = _bare_client()
+        with pytest.MonkeyPatch().context() as mp:
+            mp.setitem(__import__("sys").modules, "PIL", None)
+            mp.setitem(__import__("sys").modules, "PIL.Image", None)
+            assert px._get_pil() is None
+            with pytest.raises(ImportError, match="Pillow") as exc:
+                px._get_pil(required=True)
+            assert isinstance(exc.value.__cause__, ImportError)
+
+    def test_missing_thermal_support_is_remembered(self):
+        px = _bare_client()
+        with pytest.MonkeyPatch().context() as mp:
+            mp.setitem(__import__("sys").modules, "plexus.cameras.thermal", None)
+            with pytest.raises(ImportError, match="send_thermal_frame"):
+                px._get_thermal_builder()
+        assert isinstance(px._thermal_builder, ImportError)
+        with pytest.raises(ImportError, match="send_thermal_frame") as exc:
+            px._get_thermal_builder()
+        assert exc.value.__cause__ is px._thermal_builder
+
+
+# ---------------------------------------------------------------------------
+# stream_camera — teardown
+# ---------------------------------------------------------------------------
+
+class TestStreamCameraClose:
+    def test_close_stops_and_joins_stream_threads(self):
+        class _EndlessPipe:
+            def read1(self, n):
+                time.sleep(0.01)
+                return _TINY_JPEG
+
+        proc = MagicMock()
+        proc.stdout = _EndlessPipe()
+
+        px = Plexus(
+            api_key="plx_test",
+            source_id="cam-test",
+            endpoint="http://localhost:9999",
+            persistent_buffer=False,
+        )
+        sent = []
+        with patch("shutil.which", return_value="/usr/bin/ffmpeg"), \
+                patch("subprocess.Popen", return_value=proc), \
+                patch.object(px, "send_video_frame", side_effect=lambda *a, **k: sent.append(1)):
+            stop = px.stream_camera("rtsp://example/stream")
+            deadline = time.monotonic() + 2.0
+            while not sent and time.monotonic() < deadline:
+                time.sleep(0.01)
+            (_, thread, _), = px._camera_streams
+            px.close()
+
+        assert stop.is_set()
+        assert not thread.is_alive()
+        assert px._camera_streams == []
+        proc.terminate.assert_called()
+
+    def test_close_unblocks_a_stalled_source(self):
+        # A stalled RTSP source never yields a frame; only terminating
+        # FFmpeg (which closes its stdout) releases the blocked read.
+        terminated = threading.Event()
+
+        class _StalledPipe:
+            def read1(self, n):
+                terminated.wait(10)
+                return b""
+
+        proc = MagicMock()
+        proc.stdout = _StalledPipe()
+        proc.terminate.side_effect = terminated.set
+
+        px = Plexus(
+            api_key="plx_test",
+            source_id="cam-test",
+            endpoint="http://localhost:9999",
+            persistent_buffer=False,
+        )
+        with patch("shutil.which", return_value="/usr/bin/ffmpeg"), \
+                patch("subprocess.Popen", return_value=proc):
+            px.stream_camera("rtsp://example/stream")
+            (_, thread, _), = px._camera_streams
+            started = time.monotonic()
+            px.close()
+
+        assert time.monotonic() - started < 1.0
+        assert not thread.is_alive()
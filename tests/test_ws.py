@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import struct
 import threading
 import time
 from typing import Any, Dict, List
@@ -378,3 +379,207 @@ def test_clock_offset_computed_from_authenticated_frame():
             t.stop()
     finally:
         g.stop()
+
+
+def test_heartbeat_fires_on_schedule(gateway, monkeypatch):
+    # Shrink the interval so the test sees several beats. Deadline-based
+    # scheduling means each beat lands near its slot instead of drifting by
+    # the recv poll latency.
+    monkeypatch.setattr("plexus.ws.HEARTBEAT_INTERVAL_S", 0.2)
+    t = WebSocketTransport(
+        api_key="plx_test_abc",
+        source_id="drone-001",
+        ws_url=_url(gateway.port),
+        agent_version="9.9.9",
+    )
+    t.start()
+    try:
+        assert t.wait_authenticated(timeout=3)
+        assert _wait_until(
+            lambda: sum(1 for m in gateway.received if m.get("type") == "heartbeat") >= 3,
+            timeout=2.0,
+        )
+        hb = next(m for m in gateway.received if m["type"] == "heartbeat")
+        assert hb == {"type": "heartbeat", "source_id": "drone-001", "agent_version": "9.9.9"}
+    finally:
+        t.stop()
+
+
+def test_safe_json_accepts_bytes_and_rejects_garbage():
+    from plexus.ws import _safe_json
+    assert _safe_json(b'{"type": "typed_command", "id": "c1"}') == {
+        "type": "typed_command", "id": "c1",
+    }
+    assert _safe_json('{"type": "error"}') == {"type": "error"}
+    assert _safe_json(b"\xff\xfe not json") == {}
+    assert _safe_json(b"[1, 2]") == {}
+    assert _safe_json(None) == {}
+
+
+def test_telemetry_prefix_matches_full_frame_encoding():
+    from plexus import _json
+    from plexus.ws import _TELEMETRY_PREFIX
+    points = [{"metric": "temp", "value": 21.5, "timestamp": 1700000000000}]
+    spliced = _TELEMETRY_PREFIX + _json.dumps(points) + "}"
+    assert spliced == _json.dumps({"type": "telemetry", "points": points})
+
+
+def test_heartbeat_suppressed_while_telemetry_flows(gateway, monkeypatch):
+    monkeypatch.setattr("plexus.ws.HEARTBEAT_INTERVAL_S", 0.3)
+    t = WebSocketTransport(
+        api_key="plx_test_abc",
+        source_id="drone-001",
+        ws_url=_url(gateway.port),
+    )
+    t.start()
+    try:
+        assert t.wait_authenticated(timeout=3)
+        deadline = time.monotonic() + 1.0
+        while time.monotonic() < deadline:
+            assert t.send_points([{"metric": "rpm", "value": 1, "timestamp": 0}])
+            time.sleep(0.05)
+        assert not any(m.get("type") == "heartbeat" for m in gateway.received)
+
+        # Once the app goes quiet the heartbeat resumes.
+        assert _wait_until(
+            lambda: any(m.get("type") == "heartbeat" for m in gateway.received),
+            timeout=2.0,
+        )
+    finally:
+        t.stop()
+
+
+def test_binary_video_frame_layout():
+    from plexus.ws import _encode_binary_video_frame
+
+    payload = _encode_binary_video_frame("src", "cam0", b"JPEG", 640, 480, 1234)
+    assert payload == (
+        b"\x01\x03src\x04cam0"
+        + struct.pack(">IIq", 640, 480, 1234)
+        + b"JPEG"
+    )
+    # The cached id prefix must not leak between streams.
+    other = _encode_binary_video_frame("src", "cam1", b"", 1, 1, 0)
+    assert other.startswith(b"\x01\x03src\x04cam1")
+
+
+def test_json_video_frame_goes_through_video_sender(gateway):
+    t = WebSocketTransport(
+        api_key="plx_test_abc",
+        source_id="drone-001",
+        ws_url=_url(gateway.port),
+    )
+    t.start()
+    try:
+        assert t.wait_authenticated(timeout=3)
+        msg = {"type": "video_frame", "camera_id": "thermal:0", "frame": "AAAA"}
+        assert t.send_json_video_frame(msg) is True
+        assert _wait_until(lambda: msg in gateway.received)
+    finally:
+        t.stop()
+
+
+def test_auth_payload_reused_until_inputs_change():
+    t = WebSocketTransport(api_key="plx_test_abc", source_id="drone-001", ws_url="ws://x")
+    first = t._auth_payload()
+    assert t._auth_payload() is first
+
+    t.register_command("ping", lambda: "pong")
+    with_cmd = json.loads(t._auth_payload())
+    assert [c["name"] for c in with_cmd["commands"]] == ["ping"]
+
+    t.source_id = "drone-001_2"
+    assert json.loads(t._auth_payload())["source_id"] == "drone-001_2"
+
+
+def test_auth_payload_built_during_registration_is_not_reused(monkeypatch):
+    import plexus.ws as ws_mod
+
+    t = WebSocketTransport(api_key="plx_test_abc", source_id="drone-001", ws_url="ws://x")
+    real_dumps = ws_mod._json.dumps
+
+    def dumps_racing_register(obj):
+        # A command lands after the manifest was snapshotted.
+        monkeypatch.setattr(ws_mod._json, "dumps", real_dumps)
+        t.register_command("late", lambda cmd, params: None)
+        return real_dumps(obj)
+
+    monkeypatch.setattr(ws_mod._json, "dumps", dumps_racing_register)
+    assert "commands" not in json.loads(t._auth_payload())
+    assert [c["name"] for c in json.loads(t._auth_payload())["commands"]] == ["late"]
+
+
+def test_dispatch_ignores_unknown_and_malformed_types():
+    t = WebSocketTransport(api_key="plx_test_abc", source_id="drone-001", ws_url="ws://x")
+    t._dispatch({"type": "future_feature"})
+    t._dispatch({"type": ["not", "hashable"]})
+    t._dispatch({})
+
+
+def test_video_queue_drops_oldest_when_full():
+    t = WebSocketTransport(api_key="plx_test_abc", source_id="drone-001", ws_url="ws://x")
+    t._authenticated.set()  # no sender thread: frames stay queued
+    for i in range(4):
+        assert t.send_video_frame_async("drone-001", "cam0", bytes([i]), 1, 1, i) is True
+    queued = [t._video_queue.get_nowait() for _ in range(t._video_queue.qsize())]
+    assert [p[-1] for p in queued] == [2, 3]
+    assert t._video_dropped == 2
+
+
+def test_commands_past_concurrency_cap_are_refused_busy():
+    t = WebSocketTransport(
+        api_key="plx_test_abc", source_id="drone-001", ws_url="ws://x",
+        max_concurrent_commands=2,
+    )
+    frames: List[Dict[str, Any]] = []
+    t._send_frame = lambda f: frames.append(f) or True
+    release = threading.Event()
+    t.register_command("hold", lambda cmd, params: release.wait(5))
+
+    for i in range(3):
+        t._handle_command({"id": f"c{i}", "command": "hold"})
+    # The refused command gets a busy error and no ack.
+    assert [(f["id"], f["event"]) for f in frames if f["id"] == "c2"] == [("c2", "error")]
+    assert "busy" in frames[-1]["error"]
+
+    release.set()
+    assert _wait_until(lambda: sum(f["event"] == "result" for f in frames) == 2)
+    t._handle_command({"id": "after", "command": "hold"})
+    assert _wait_until(lambda: any(f["id"] == "after" and f["event"] == "result" for f in frames))
+
+
+def test_no_command_cap_when_none():
+    t = WebSocketTransport(
+        api_key="plx_test_abc", source_id="drone-001", ws_url="ws://x",
+        max_concurrent_commands=None,
+    )
+    frames: List[Dict[str, Any]] = []
+    t._send_frame = lambda f: frames.append(f) or True
+    release = threading.Event()
+    t.register_command("hold", lambda cmd, params: release.wait(5))
+
+    for i in range(10):
+        t._handle_command({"id": f"c{i}", "command": "hold"})
+    assert not any(f["event"] == "error" for f in frames)
+    release.set()
+    assert _wait_until(lambda: sum(f["event"] == "result" for f in frames) == 10)
+
+
+def test_slot_released_when_handler_thread_cannot_start(monkeypatch):
+    t = WebSocketTransport(
+        api_key="plx_test_abc", source_id="drone-001", ws_url="ws://x",
+        max_concurrent_commands=1,
+    )
+    frames: List[Dict[str, Any]] = []
+    t._send_frame = lambda f: frames.append(f) or True
+    t.register_command("ping", lambda cmd, params: "pong")
+
+    def _fail(self):
+        raise RuntimeError("can't start new thread")
+
+    with monkeypatch.context() as mp:
+        mp.setattr(threading.Thread, "start", _fail)
+        t._handle_command({"id": "c0", "command": "ping"})
+    assert frames[-1]["event"] == "error"
+    t._handle_command({"id": "c1", "command": "ping"})
+    assert _wait_until(lambda: any(f["id"] == "c1" and f["event"] == "result" for f in frames))